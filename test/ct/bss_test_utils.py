@@ -1,6 +1,6 @@
 # MIT License
 #
-# (C) Copyright [2022] Hewlett Packard Enterprise Development LP
+# (C) Copyright [2022-2026] Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -23,6 +23,7 @@
 import socket
 from box import Box
 
+import functools
 import json
 import jmespath
 import logging
@@ -33,12 +34,27 @@ from tavern.util.dict_util import recurse_access_key,check_keys_match_recursive
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=256)
+def _compiled(expression):
+    # Tavern steps reuse the same handful of expressions, so compile each once
+    return re.compile(expression)
+
+@functools.lru_cache(maxsize=1)
+def _test_container_ip_address():
+    # The container's own address does not change during a test run
+    hostname = socket.gethostname()
+    return socket.gethostbyname(hostname)
+
 def build_hsm_ethernet_interface_for_test_container():
     # Determine the IP of the container
-    hostname = socket.gethostname()
-    ip_address = socket.gethostbyname(hostname)
+    ip_address = _test_container_ip_address()
 
     # Build up a HSM EthernetInterface with this containers IP address
     return {
@@ -52,23 +68,24 @@ def build_hsm_ethernet_interface_for_test_container():
 
 def save_ip_address_of_test_container(response):
     # Determine the IP of the container
-    hostname = socket.gethostname()
-    ip_address = socket.gethostbyname(hostname)
+    ip_address = _test_container_ip_address()
 
     return Box({"test_container_ip_address": ip_address})
 
 def better_validate_regex(response, expression):
-    logger.debug("Matching %s with %s", response.text, expression)
+    # response.text is decoded on every access, so only do it once
+    text = response.text
+    logger.debug("Matching %s with %s", text, expression)
 
-    match = re.search(expression, response.text)
+    match = _compiled(expression).search(text)
     if match is None:
-        raise exceptions.RegexAccessError(f"No match for regex '{expression}' in response:\n{response.text}")
+        raise exceptions.RegexAccessError(f"No match for regex '{expression}' in response:\n{text}")
 
     return {"regex": Box(match.groupdict())}
 
 
 def validate_yaml_simple(response, expected):
-    response_data = yaml.safe_load(response.text)
+    response_data = yaml.load(response.text, Loader=_Loader)
 
     check_keys_match_recursive(response_data, expected, [])
 